@@ -4,13 +4,26 @@ Finnhub US Stock Service
 Provides comprehensive US stock market data via Finnhub API.
 """
 import os
+import copy
+import json
+import hashlib
 import logging
 import datetime
+import time
 import asyncio
-from typing import Any, Dict, Optional
-import finnhub
+import calendar
+import functools
+import email.utils
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import httpx
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
@@ -18,6 +31,127 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+FINNHUB_BASE_URL = "https://finnhub.io/api/v1"
+
+# Endpoint name (as in the finnhub-python client) -> REST path
+FINNHUB_ENDPOINTS = {
+    'quote': '/quote',
+    'company_profile2': '/stock/profile2',
+    'company_peers': '/stock/peers',
+    'company_basic_financials': '/stock/metric',
+    'company_earnings': '/stock/earnings',
+    'stock_dividends': '/stock/dividend',
+    'recommendation_trends': '/stock/recommendation',
+    'company_news': '/company-news',
+    'transcripts': '/stock/transcripts',
+    'transcripts_list': '/stock/transcripts/list',
+    'company_executive': '/stock/executive',
+    'filings': '/stock/filings',
+    'stock_insider_transactions': '/stock/insider-transactions',
+    'ownership': '/stock/ownership',
+    'fund_ownership': '/stock/fund-ownership',
+    'news_sentiment': '/news-sentiment',
+    'stock_social_sentiment': '/stock/social-sentiment',
+    'stock_insider_sentiment': '/stock/insider-sentiment',
+    'upgrade_downgrade': '/stock/upgrade-downgrade',
+    'pattern_recognition': '/scan/pattern',
+    'support_resistance': '/scan/support-resistance',
+    'aggregate_indicator': '/scan/technical-indicator',
+}
+
+# In-process cache TTLs (seconds) per endpoint name; endpoints not listed use DEFAULT_CACHE_TTL
+CACHE_TTLS = {
+    'quote': 30,
+    'company_news': 600,
+    'news_sentiment': 600,
+    'stock_social_sentiment': 600,
+    'company_profile2': 86400,
+    'company_peers': 86400,
+    'company_executive': 86400,
+}
+DEFAULT_CACHE_TTL = 3600
+CACHE_MAX_SIZE = 4096
+
+# Short TTL for negative results (404 / empty payloads) so dead tickers are not re-fetched
+NEGATIVE_CACHE_TTL = 300
+# Cache marker for endpoints that answered 404
+_NOT_FOUND = object()
+
+# Retry policy for transient failures (connection errors, timeouts, 429, 5xx)
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF = 0.2
+RETRY_BACKOFF_MAX = 2.0
+
+# Slow-changing endpoints additionally persisted on disk across restarts (TTL in seconds).
+# Date-range queries ('to' param, e.g. filings) are only persisted once the range has closed.
+DISK_CACHE_TTLS = {
+    'filings': 86400 * 7,
+    'transcripts': 86400 * 7,
+    'transcripts_list': 86400,
+    'company_executive': 86400 * 7,
+    'ownership': 86400 * 7,
+    'fund_ownership': 86400 * 7,
+}
+
+class _RateLimiter:
+    """Async token bucket allowing `rate` acquisitions per `period` seconds."""
+
+    def __init__(self, rate: int, period: float):
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate / self.period)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self.period / self.rate)
+
+    async def __aexit__(self, *exc):
+        return False
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Seconds to wait according to a Retry-After header, given either as
+    delta-seconds or as an HTTP-date. Returns None if missing or invalid.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=datetime.timezone.utc)
+    return max(0.0, (when - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+@functools.lru_cache(maxsize=1024)
+def _date_to_timestamp(date_str: str, end_of_day: bool = False) -> int:
+    """
+    Convert 'YYYY-MM-DD' string to Unix timestamp (UTC), memoized per date.
+    Args:
+        date_str: Date string in YYYY-MM-DD format.
+        end_of_day: If True, set time to 23:59:59.
+    """
+    try:
+        d = datetime.date.fromisoformat(date_str)
+    except ValueError:
+        logger.error("Invalid date format: %s, expected YYYY-MM-DD", date_str)
+        return 0
+    # timegm treats the tuple as UTC, so no tz-aware datetime is needed
+    timestamp = calendar.timegm(d.timetuple())
+    return timestamp + 86399 if end_of_day else timestamp
+
 class FinnhubService:
     """
     Finnhub US Stock Service.
@@ -28,8 +162,31 @@ class FinnhubService:
     - Financials & Dividends
     - Analyst Estimates & Ratings
     - News & Sentiment Analysis
+
+    Outbound requests are throttled client-side across all instances; override via env:
+    - FINNHUB_MAX_CONC: max concurrent requests to Finnhub (default 8)
+    - FINNHUB_RATE_LIMIT: max requests per minute per API key (default 60, free tier)
+
+    All instances share one HTTP connection pool, response cache and in-flight
+    request map, so constructing the service per request is cheap and still gets
+    cache hits and request coalescing; call aclose() once at application shutdown.
+    Cached responses are keyed by call only, not by API key, and every caller
+    receives its own copy, so mutating a result never affects the cache.
     """
 
+    # Shared keep-alive HTTP/2 client, created lazily inside the running loop
+    _http: Optional[httpx.AsyncClient] = None
+    _http_loop: Optional[asyncio.AbstractEventLoop] = None
+    # Throttling shared with the client: per-host concurrency cap and per-key rate limiters
+    _http_sem: Optional[asyncio.Semaphore] = None
+    _limiters: Dict[str, _RateLimiter] = {}
+    # Response cache: (endpoint, params, limit) -> (expires_at, data)
+    _cache: Dict[Tuple, Tuple[float, Any]] = {}
+    # In-flight requests: (endpoint, params, limit) -> task shared by concurrent callers
+    _inflight: Dict[Tuple, asyncio.Task] = {}
+    # Disk cache directories already created, so mkdir runs once per directory
+    _cache_dirs_ready: set = set()
+
     def __init__(self, api_key: Optional[str] = None):
         self.name = "Finnhub US Stock Service"
         # Get API key from environment if not provided
@@ -37,13 +194,14 @@ class FinnhubService:
         
         if not self.api_key:
             logger.warning("FINNHUB_API_KEY not found in environment variables")
-        
-        try:
-            self.client = finnhub.Client(api_key=self.api_key)
-            logger.info("FinnhubService initialized")
-        except Exception as e:
-            logger.error(f"Failed to initialize Finnhub client: {str(e)}")
-            self.client = None
+
+        # Request URLs and headers are fixed per service, build them once
+        self._urls = {name: f"{FINNHUB_BASE_URL}{path}" for name, path in FINNHUB_ENDPOINTS.items()}
+        self._headers = {"X-Finnhub-Token": self.api_key or "", "Accept-Encoding": "gzip"}
+
+        # Disk cache for slow-changing endpoints (directory created on first write)
+        self.cache_dir = Path(os.getenv('FINNHUB_CACHE_DIR', 'data/cache/finnhub'))
+        logger.info("FinnhubService initialized")
 
     def _date_to_timestamp(self, date_str: str, end_of_day: bool = False) -> int:
         """
@@ -52,44 +210,243 @@ class FinnhubService:
             date_str: Date string in YYYY-MM-DD format.
             end_of_day: If True, set time to 23:59:59.
         """
-        try:
-            dt = datetime.datetime.strptime(date_str, "%Y-%m-%d")
-            if end_of_day:
-                dt = dt.replace(hour=23, minute=59, second=59)
-            return int(dt.replace(tzinfo=datetime.timezone.utc).timestamp())
-        except ValueError:
-            logger.error(f"Invalid date format: {date_str}, expected YYYY-MM-DD")
-            return 0
-
-    def _safe_api_call(self, func, *args, **kwargs) -> Any:
-        """Helper to wrap API calls with try-except block."""
-        if not self.client:
+        return _date_to_timestamp(date_str, end_of_day)
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the HTTP client shared by all instances, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        cls = FinnhubService
+        # A client is bound to its event loop; start a new one if the loop changed
+        if cls._http is None or cls._http.is_closed or cls._http_loop is not loop:
+            # HTTP/2 multiplexes concurrent requests over a single connection
+            cls._http = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=60),
+                timeout=10.0
+            )
+            cls._http_loop = loop
+            # asyncio primitives are loop-bound too, so reset them with the client
+            cls._http_sem = asyncio.Semaphore(int(os.getenv('FINNHUB_MAX_CONC', 8)))
+            cls._limiters = {}
+            # Tasks from the previous loop can never complete here
+            cls._inflight = {}
+        return cls._http
+
+    def _get_limiter(self) -> _RateLimiter:
+        """Return the rate limiter for this service's API key."""
+        limiter = FinnhubService._limiters.get(self.api_key)
+        if limiter is None:
+            limiter = _RateLimiter(int(os.getenv('FINNHUB_RATE_LIMIT', 60)), 60)
+            FinnhubService._limiters[self.api_key] = limiter
+        return limiter
+
+    async def aclose(self):
+        """Close the shared HTTP client. Call at application shutdown, not per request."""
+        cls = FinnhubService
+        if cls._http is not None and not cls._http.is_closed:
+            await cls._http.aclose()
+        cls._http = None
+        cls._http_loop = None
+
+    def _cache_get(self, key: Tuple) -> Any:
+        """Return cached data for key, or None if missing or expired."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, data = entry
+        if time.monotonic() >= expires_at:
+            del self._cache[key]
             return None
+        return data
+
+    def _cache_set(self, key: Tuple, data: Any, ttl: float):
+        """Store data for key, evicting expired then oldest entries when full."""
+        if len(self._cache) >= CACHE_MAX_SIZE:
+            now = time.monotonic()
+            for k in [k for k, (exp, _) in self._cache.items() if exp <= now]:
+                del self._cache[k]
+            while len(self._cache) >= CACHE_MAX_SIZE:
+                del self._cache[next(iter(self._cache))]
+        self._cache[key] = (time.monotonic() + ttl, data)
+
+    def _disk_cache_file(self, key: Tuple) -> Path:
+        """Map a cache key to its file, e.g. filings_<hash>.json."""
+        digest = hashlib.md5(repr(key).encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key[0]}_{digest}.json"
+
+    def _load_disk_cache(self, key: Tuple, ttl: float) -> Optional[Any]:
+        """Load data from disk cache if valid"""
+        cache_file = self._disk_cache_file(key)
+        if cache_file.exists():
+            try:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    cache_data = json.load(f)
+                if time.time() - cache_data.get('timestamp', 0) < ttl:
+                    return cache_data.get('data')
+            except Exception as e:
+                logger.warning("Cache read error: %s", e)
+        return None
+
+    def _save_disk_cache(self, key: Tuple, data: Any):
+        """Save data to disk cache"""
         try:
-            return func(*args, **kwargs)
+            if self.cache_dir not in FinnhubService._cache_dirs_ready:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                FinnhubService._cache_dirs_ready.add(self.cache_dir)
+            with open(self._disk_cache_file(key), 'w', encoding='utf-8') as f:
+                json.dump({'timestamp': time.time(), 'data': data}, f, ensure_ascii=False)
         except Exception as e:
-            logger.warning(f"API call failed: {str(e)}")
+            logger.warning("Cache write error: %s", e)
+
+    @staticmethod
+    def _cache_key(endpoint: str, params: Dict[str, Any] = None, limit: Optional[int] = None) -> Tuple:
+        """Key identifying an API call for caching and de-duplication."""
+        return (endpoint, tuple(sorted((params or {}).items())), limit)
+
+    async def _safe_api_call(self, endpoint: str, params: Dict[str, Any] = None,
+                             limit: Optional[int] = None) -> Any:
+        """
+        Helper to perform cached REST API calls with try-except block.
+        Concurrent calls for the same endpoint and params share one request.
+        Args:
+            limit: If set, list responses are truncated to this many items before caching.
+        """
+        if not self.api_key:
             return None
 
-    def _format_response(self, data: Any, meta: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Standardized response format."""
+        key = self._cache_key(endpoint, params, limit)
+        cached = self._cache_get(key)
+        if cached is _NOT_FOUND:
+            return None
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        # Binds the shared client state (including the in-flight map) to this loop first
+        await self._get_client()
+        inflight = FinnhubService._inflight
+        task = inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, endpoint, params, limit))
+            inflight[key] = task
+            # Only drop our own entry; the map may have been reset or reused since
+            task.add_done_callback(lambda t: inflight.pop(key) if inflight.get(key) is t else None)
+        # Shield so a cancelled caller does not cancel the request for the others;
+        # the result is the cached object, shared with every coalesced caller
+        return copy.deepcopy(await asyncio.shield(task))
+
+    async def _bulk_fetch(self, calls: List[Tuple]) -> List[Any]:
+        """
+        Fetch several endpoints concurrently, issuing each distinct call once.
+        Args:
+            calls: (endpoint, params[, limit]) tuples, as accepted by _safe_api_call.
+        Returns:
+            List: Results in the same order as calls.
+        """
+        keys = [self._cache_key(*call) for call in calls]
+        unique = {}
+        for key, call in zip(keys, calls):
+            unique.setdefault(key, call)
+        results = await asyncio.gather(*[self._safe_api_call(*call) for call in unique.values()])
+        by_key = dict(zip(unique, results))
+        return [by_key[key] for key in keys]
+
+    async def _load(self, key: Tuple, endpoint: str, params: Dict[str, Any] = None,
+                    limit: Optional[int] = None) -> Any:
+        """Load data from disk cache or network and populate the caches."""
+        ttl = CACHE_TTLS.get(endpoint, DEFAULT_CACHE_TTL)
+        disk_ttl = DISK_CACHE_TTLS.get(endpoint)
+        # A range ending today or later can still gain records; keep it in memory only
+        end_date = (params or {}).get('to')
+        if end_date and str(end_date) >= datetime.date.today().isoformat():
+            disk_ttl = None
+        if disk_ttl:
+            # File I/O runs in a worker thread to keep the event loop free
+            cached = await asyncio.to_thread(self._load_disk_cache, key, disk_ttl)
+            if cached is not None:
+                self._cache_set(key, cached, ttl)
+                return cached
+
+        data = await self._request(endpoint, params)
+        if data is _NOT_FOUND or data == {} or data == []:
+            # Negative result (unknown or delisted symbol): remember it briefly, never on disk
+            logger.debug("Negative-caching %s %s for %ss", endpoint, params, NEGATIVE_CACHE_TTL)
+            self._cache_set(key, data, NEGATIVE_CACHE_TTL)
+            return None if data is _NOT_FOUND else data
+
+        if limit is not None and isinstance(data, list):
+            data = data[:limit]
+        if data is not None:
+            self._cache_set(key, data, ttl)
+            if disk_ttl:
+                await asyncio.to_thread(self._save_disk_cache, key, data)
+        return data
+
+    async def _request(self, endpoint: str, params: Dict[str, Any] = None) -> Any:
+        """
+        Perform a throttled REST API call, returning None on failure and
+        _NOT_FOUND on 404.
+        Connection errors, timeouts, 429 and 5xx responses are retried with
+        exponential backoff (or the server's Retry-After, capped at
+        RETRY_BACKOFF_MAX) up to RETRY_ATTEMPTS.
+        """
+        client = await self._get_client()
+        sem, limiter = FinnhubService._http_sem, self._get_limiter()
+        error = None
+        for attempt in range(1, RETRY_ATTEMPTS + 1):
+            delay = min(RETRY_BACKOFF * 2 ** (attempt - 1), RETRY_BACKOFF_MAX)
+            try:
+                async with sem, limiter:
+                    response = await client.get(self._urls[endpoint], params=params, headers=self._headers)
+                if response.status_code == 404:
+                    return _NOT_FOUND
+                if response.status_code == 429 or response.status_code >= 500:
+                    retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+                    if retry_after is not None:
+                        # Honour the server's hint, but never stall callers longer than our own backoff cap
+                        delay = min(retry_after, RETRY_BACKOFF_MAX)
+                    error = f"HTTP {response.status_code}"
+                else:
+                    response.raise_for_status()
+                    return orjson.loads(response.content) if orjson else json.loads(response.content)
+            except httpx.HTTPStatusError as e:
+                logger.warning("API call to %s failed: %s", endpoint, e)
+                return None
+            except httpx.TransportError as e:
+                error = str(e) or type(e).__name__
+            except Exception as e:
+                logger.warning("API call to %s failed: %s", endpoint, e)
+                return None
+
+            if attempt < RETRY_ATTEMPTS:
+                # Sleep outside the semaphore so other requests can proceed
+                logger.warning("API call to %s failed (%s), retry %d/%d in %ss", endpoint, error, attempt, RETRY_ATTEMPTS - 1, delay)
+                await asyncio.sleep(delay)
+
+        logger.warning("API call to %s failed after %d attempts: %s", endpoint, RETRY_ATTEMPTS, error)
+        return None
+
+    def _format_response(self, data: Any, meta: Dict[str, Any] = None,
+                         now: Optional[datetime.datetime] = None) -> Dict[str, Any]:
+        """
+        Standardized response format.
+        Args:
+            now: Query time to report; taken from the clock when omitted.
+        """
+        metadata = {
+            "query_time": (now or datetime.datetime.now()).strftime("%Y-%m-%d %H:%M:%S"),
+            **(meta or {})
+        }
         if data is None:
             return {
                 "success": False,
                 "error": "No data returned or API error",
-                "metadata": {
-                    "query_time": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    **(meta or {})
-                }
+                "metadata": metadata
             }
         return {
             "success": True,
-            "found": True if data else False,
+            "found": bool(data),
             "data": data,
-            "metadata": {
-                "query_time": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                **(meta or {})
-            }
+            "metadata": metadata
         }
 
     async def _get_company_profile(self, symbol: str) -> Dict[str, Any]:
@@ -104,11 +461,11 @@ class FinnhubService:
         """
         data = {}
         
-        # 1. Company Profile 2
-        data['profile'] = self._safe_api_call(self.client.company_profile2, symbol=symbol)
-        
-        # 2. Company Peers
-        data['peers'] = self._safe_api_call(self.client.company_peers, symbol)
+        # 1. Company Profile 2, 2. Company Peers
+        data['profile'], data['peers'] = await asyncio.gather(
+            self._safe_api_call('company_profile2', {'symbol': symbol}),
+            self._safe_api_call('company_peers', {'symbol': symbol})
+        )
         
         return self._format_response(data, {"symbol": symbol})
 
@@ -125,7 +482,7 @@ class FinnhubService:
         """
         data = {}
         # 1. Real-time Quote
-        data['quote'] = self._safe_api_call(self.client.quote, symbol)
+        data['quote'] = await self._safe_api_call('quote', {'symbol': symbol})
 
         return self._format_response(data, {"symbol": symbol, "period": f"{start_date} to {end_date}"})
 
@@ -143,13 +500,13 @@ class FinnhubService:
         data = {}
 
         # 1. Basic Financials (Metric 'all')
-        data['basic_financials'] = self._safe_api_call(self.client.company_basic_financials, symbol, 'all')
-
         # 2. Earnings Surprises (Limit to last 4 quarters)
-        data['earnings_surprises'] = self._safe_api_call(self.client.company_earnings, symbol, limit=4)
-
         # 3. Dividends
-        data['dividends'] = self._safe_api_call(self.client.stock_dividends, symbol, _from=start_date, to=end_date)
+        data['basic_financials'], data['earnings_surprises'], data['dividends'] = await asyncio.gather(
+            self._safe_api_call('company_basic_financials', {'symbol': symbol, 'metric': 'all'}),
+            self._safe_api_call('company_earnings', {'symbol': symbol, 'limit': 4}),
+            self._safe_api_call('stock_dividends', {'symbol': symbol, 'from': start_date, 'to': end_date})
+        )
 
         return self._format_response(data, {"symbol": symbol, "period": f"{start_date} to {end_date}"})
 
@@ -168,7 +525,7 @@ class FinnhubService:
         data = {}
 
         # 1. Recommendation Trends
-        data['recommendation_trends'] = self._safe_api_call(self.client.recommendation_trends, symbol)
+        data['recommendation_trends'] = await self._safe_api_call('recommendation_trends', {'symbol': symbol})
 
         return self._format_response(data, {"symbol": symbol, "period": f"{start_date} to {end_date}"})
 
@@ -188,12 +545,10 @@ class FinnhubService:
         data = {}
 
         # 1. Company News (Last 10 items)
-        news = self._safe_api_call(self.client.company_news, symbol, _from=start_date, to=end_date)
-        if isinstance(news, list):
-            data['news'] = news[:10]
-        else:
-            data['news'] = news
-            
+        data['news'] = await self._safe_api_call(
+            'company_news', {'symbol': symbol, 'from': start_date, 'to': end_date}, limit=10
+        )
+
         return self._format_response(data, {"symbol": symbol, "period": f"{start_date} to {end_date}"})
 
     async def _get_all_stock_info(self, symbol: str, start_date: str, end_date: str) -> Dict[str, Any]:
@@ -214,36 +569,31 @@ class FinnhubService:
                   - analysis
                   - sentiment
         """
-        # Collect raw data from sub-methods
-        # We unwrap the 'data' field from each sub-method response if successful
-        
-        raw_data = {}
-        
-        profile_res = await self._get_company_profile(symbol)
-        if profile_res.get("success"):
-            raw_data['company_profile'] = profile_res.get("data")
+        now = datetime.datetime.now()
+        period = {'symbol': symbol, 'from': start_date, 'to': end_date}
+
+        # (section, field, call) - same layout as the individual sub-methods return
+        plan = [
+            ('company_profile', 'profile', ('company_profile2', {'symbol': symbol})),
+            ('company_profile', 'peers', ('company_peers', {'symbol': symbol})),
+            ('market_data', 'quote', ('quote', {'symbol': symbol})),
+            ('financials', 'basic_financials', ('company_basic_financials', {'symbol': symbol, 'metric': 'all'})),
+            ('financials', 'earnings_surprises', ('company_earnings', {'symbol': symbol, 'limit': 4})),
+            ('financials', 'dividends', ('stock_dividends', period)),
+            ('analysis', 'recommendation_trends', ('recommendation_trends', {'symbol': symbol})),
+            ('sentiment', 'news', ('company_news', period, 10)),
+        ]
+        results = await self._bulk_fetch([call for _, _, call in plan])
 
-        market_res = await self._get_market_data(symbol, start_date, end_date)
-        if market_res.get("success"):
-            raw_data['market_data'] = market_res.get("data")
-            
-        financial_res = await self._get_financials(symbol, start_date, end_date)
-        if financial_res.get("success"):
-            raw_data['financials'] = financial_res.get("data")
-            
-        analysis_res = await self._get_estimates_and_analysis(symbol, start_date, end_date)
-        if analysis_res.get("success"):
-            raw_data['analysis'] = analysis_res.get("data")
-            
-        sentiment_res = await self._get_sentiment_and_news(symbol, start_date, end_date)
-        if sentiment_res.get("success"):
-            raw_data['sentiment'] = sentiment_res.get("data")
+        raw_data = {}
+        for (section, field, _), result in zip(plan, results):
+            raw_data.setdefault(section, {})[field] = result
 
         return self._format_response(raw_data, {
             "symbol": symbol, 
             "period": f"{start_date} to {end_date}",
-            "generated_at": datetime.datetime.now().isoformat()
-        })
+            "generated_at": now.isoformat()
+        }, now=now)
 
     async def _fetch_transcripts(self, transcript_id: str) -> Dict[str, Any]:
         """
@@ -255,7 +605,7 @@ class FinnhubService:
         Returns:
             Dict: Transcript content and metadata.
         """
-        data = self._safe_api_call(self.client.transcripts, transcript_id)
+        data = await self._safe_api_call('transcripts', {'id': transcript_id})
         return self._format_response(data, {"transcript_id": transcript_id})
     
     async def _fetch_transcripts_list(self, symbol: str) -> Dict[str, Any]:
@@ -268,7 +618,7 @@ class FinnhubService:
         Returns:
             Dict: List of available transcripts with IDs and dates.
         """
-        data = self._safe_api_call(self.client.transcripts_list, symbol)
+        data = await self._safe_api_call('transcripts_list', {'symbol': symbol})
         return self._format_response(data, {"symbol": symbol})
     
     async def _fetch_company_executives(self, symbol: str) -> Dict[str, Any]:
@@ -281,7 +631,7 @@ class FinnhubService:
         Returns:
             Dict: Company executive profiles including name, position, compensation.
         """
-        data = self._safe_api_call(self.client.company_executive, symbol)
+        data = await self._safe_api_call('company_executive', {'symbol': symbol})
         return self._format_response(data, {"symbol": symbol})
     
     async def _fetch_sec_filings(self, symbol: str, start_date: str, end_date: str) -> Dict[str, Any]:
@@ -296,7 +646,7 @@ class FinnhubService:
         Returns:
             Dict: SEC filing records.
         """
-        data = self._safe_api_call(self.client.filings, symbol=symbol, _from=start_date, to=end_date)
+        data = await self._safe_api_call('filings', {'symbol': symbol, 'from': start_date, 'to': end_date})
         return self._format_response(data, {"symbol": symbol, "period": f"{start_date} to {end_date}"})
     
     async def _fetch_insider_transactions(self, symbol: str, start_date: str, end_date: str) -> Dict[str, Any]:
@@ -311,7 +661,7 @@ class FinnhubService:
         Returns:
             Dict: Insider transaction records (buy/sell by executives).
         """
-        data = self._safe_api_call(self.client.stock_insider_transactions, symbol, start_date, end_date)
+        data = await self._safe_api_call('stock_insider_transactions', {'symbol': symbol, 'from': start_date, 'to': end_date})
         return self._format_response(data, {"symbol": symbol, "period": f"{start_date} to {end_date}"})
     
     async def _fetch_institutional_ownership(self, symbol: str, start_date: str, end_date: str) -> Dict[str, Any]:
@@ -326,7 +676,7 @@ class FinnhubService:
         Returns:
             Dict: Institutional holdings and ownership changes.
         """
-        data = self._safe_api_call(self.client.ownership, symbol, limit=10)
+        data = await self._safe_api_call('ownership', {'symbol': symbol, 'limit': 10})
         return self._format_response(data, {"symbol": symbol, "period": f"{start_date} to {end_date}"})
     
     async def _fetch_fund_ownership(self, symbol: str) -> Dict[str, Any]:
@@ -339,7 +689,7 @@ class FinnhubService:
         Returns:
             Dict: Mutual fund holdings.
         """
-        data = self._safe_api_call(self.client.fund_ownership, symbol, limit=10)
+        data = await self._safe_api_call('fund_ownership', {'symbol': symbol, 'limit': 10})
         return self._format_response(data, {"symbol": symbol})
     
     async def _fetch_news_sentiment(self, symbol: str) -> Dict[str, Any]:
@@ -352,7 +702,7 @@ class FinnhubService:
         Returns:
             Dict: News sentiment metrics (bullish/bearish scores, article count).
         """
-        data = self._safe_api_call(self.client.news_sentiment, symbol)
+        data = await self._safe_api_call('news_sentiment', {'symbol': symbol})
         return self._format_response(data, {"symbol": symbol})
     
     async def _fetch_social_sentiment(self, symbol: str) -> Dict[str, Any]:
@@ -365,7 +715,7 @@ class FinnhubService:
         Returns:
             Dict: Social media sentiment scores and mention counts.
         """
-        data = self._safe_api_call(self.client.stock_social_sentiment, symbol)
+        data = await self._safe_api_call('stock_social_sentiment', {'symbol': symbol})
         return self._format_response(data, {"symbol": symbol})
     
     async def _fetch_insider_sentiment(self, symbol: str, start_date: str, end_date: str) -> Dict[str, Any]:
@@ -380,7 +730,7 @@ class FinnhubService:
         Returns:
             Dict: Insider sentiment metrics (MSPR - Monthly Share Purchase Ratio).
         """
-        data = self._safe_api_call(self.client.stock_insider_sentiment, symbol, start_date, end_date)
+        data = await self._safe_api_call('stock_insider_sentiment', {'symbol': symbol, 'from': start_date, 'to': end_date})
         return self._format_response(data, {"symbol": symbol, "period": f"{start_date} to {end_date}"})
     
     async def _fetch_upgrade_downgrade(self, symbol: str, start_date: str, end_date: str) -> Dict[str, Any]:
@@ -395,7 +745,7 @@ class FinnhubService:
         Returns:
             Dict: Analyst rating change events.
         """
-        data = self._safe_api_call(self.client.upgrade_downgrade, symbol=symbol, _from=start_date, to=end_date)
+        data = await self._safe_api_call('upgrade_downgrade', {'symbol': symbol, 'from': start_date, 'to': end_date})
         return self._format_response(data, {"symbol": symbol, "period": f"{start_date} to {end_date}"})
     
     async def _fetch_pattern_recognition(self, symbol: str, resolution: str = 'D') -> Dict[str, Any]:
@@ -409,7 +759,7 @@ class FinnhubService:
         Returns:
             Dict: Detected chart patterns (head and shoulders, triangles, etc).
         """
-        data = self._safe_api_call(self.client.pattern_recognition, symbol, resolution)
+        data = await self._safe_api_call('pattern_recognition', {'symbol': symbol, 'resolution': resolution})
         return self._format_response(data, {"symbol": symbol, "resolution": resolution})
     
     async def _fetch_support_resistance(self, symbol: str, resolution: str = 'D') -> Dict[str, Any]:
@@ -423,7 +773,7 @@ class FinnhubService:
         Returns:
             Dict: Support and resistance price levels.
         """
-        data = self._safe_api_call(self.client.support_resistance, symbol, resolution)
+        data = await self._safe_api_call('support_resistance', {'symbol': symbol, 'resolution': resolution})
         return self._format_response(data, {"symbol": symbol, "resolution": resolution})
     
     async def _fetch_aggregate_indicator(self, symbol: str, resolution: str = 'D') -> Dict[str, Any]:
@@ -437,14 +787,14 @@ class FinnhubService:
         Returns:
             Dict: Aggregate buy/sell/neutral signals from multiple indicators.
         """
-        data = self._safe_api_call(self.client.aggregate_indicator, symbol, resolution)
+        data = await self._safe_api_call('aggregate_indicator', {'symbol': symbol, 'resolution': resolution})
         return self._format_response(data, {"symbol": symbol, "resolution": resolution})
 
 if __name__ == "__main__":
     # Test Block
     async def test():
         service = FinnhubService()
-        symbol = "AAPL"
+        symbols = ["AAPL", "MSFT", "GOOG", "NVDA", "TSLA"]
         
         # Dynamic date range: Last 30 days
         end_dt = datetime.datetime.now()
@@ -453,17 +803,21 @@ if __name__ == "__main__":
         start = start_dt.strftime("%Y-%m-%d")
         end = end_dt.strftime("%Y-%m-%d")
         
-        print(f"--- Testing _get_all_stock_info for {symbol} ---")
-        res = await service._get_all_stock_info(symbol, start, end)
-        
-        # Print simplified structure check
-        print(f"Success: {res.get('success')}")
-        if res.get('success'):
-            data = res.get('data', {})
-            print(f"Keys: {list(data.keys())}")
-            if 'company_profile' in data:
-                print(f"Profile Name: {data['company_profile'].get('profile', {}).get('name')}")
-
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    loop.run_until_complete(test())
+        try:
+            print(f"--- Testing _get_all_stock_info for {', '.join(symbols)} ---")
+            t0 = time.perf_counter()
+            results = await asyncio.gather(*[service._get_all_stock_info(s, start, end) for s in symbols])
+            print(f"Fetched {len(symbols)} symbols in {time.perf_counter() - t0:.2f}s")
+            
+            # Print simplified structure check
+            for symbol, res in zip(symbols, results):
+                print(f"{symbol} Success: {res.get('success')}")
+                if res.get('success'):
+                    data = res.get('data', {})
+                    print(f"  Keys: {list(data.keys())}")
+                    if 'company_profile' in data:
+                        print(f"  Profile Name: {(data['company_profile'].get('profile') or {}).get('name')}")
+        finally:
+            await service.aclose()
+
+    asyncio.run(test())
@@ -10,10 +10,16 @@ import json
 import time
 from pathlib import Path
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Literal
+from typing import Any, AsyncIterator, Dict, List, Optional, Literal, Tuple, Union
+import numpy as np
 import pandas as pd
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
@@ -29,6 +35,28 @@ except ImportError:
 FreqType = Literal["1MIN", "5MIN", "15MIN", "30MIN", "60MIN"]
 
 
+def _nullable(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast to object dtype with NaN replaced by None, ready for to_dict('records')"""
+    return df.astype(object).where(df.notna(), None)
+
+
+def _to_str(s: pd.Series) -> pd.Series:
+    """Stringify non-null values, keeping nulls as None"""
+    return s.astype(str).astype(object).where(s.notna(), None)
+
+
+_now_str_cache: Tuple[int, str] = (0, "")
+
+
+def _cached_now_str() -> str:
+    """Current local time as 'YYYY-MM-DD HH:MM:SS', formatted at most once per second"""
+    global _now_str_cache
+    now = int(time.time())
+    if now != _now_str_cache[0]:
+        _now_str_cache = (now, datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S"))
+    return _now_str_cache[1]
+
+
 class TushareRealtimeService:
     """
     A股实时分钟行情服务
@@ -39,7 +67,15 @@ class TushareRealtimeService:
     - 支持股票名称/代码双向查询
     """
     
-    FREQ_OPTIONS = ["1MIN", "5MIN", "15MIN", "30MIN", "60MIN"]
+    FREQ_OPTIONS_DISPLAY = ("1MIN", "5MIN", "15MIN", "30MIN", "60MIN")
+    FREQ_OPTIONS = frozenset(FREQ_OPTIONS_DISPLAY)
+    
+    # realtime_quote codes per request by source, and concurrent requests per call
+    QUOTE_CHUNK_SIZE = {"sina": 50, "dc": 1}
+    QUOTE_CONCURRENCY = 5
+    
+    # Tick records converted per chunk when streaming
+    TICK_CHUNK_SIZE = 500
     
     def __init__(self, token: Optional[str] = None):
         self.name = "Tushare Realtime Service"
@@ -50,6 +86,18 @@ class TushareRealtimeService:
         self.cache_dir = Path("data/cache/tushare")
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache_expire_hours = 24  # Cache expiration for stock basic info
+        self.list_cache_seconds = 5  # Market snapshot reuse across realtime_list rankings
+        self.cache_debug = os.getenv('TUSHARE_CACHE_DEBUG', '').lower() in ('1', 'true')  # Pretty-print JSON cache
+        
+        # In-memory stock basic info, plus name <-> code lookups rebuilt on every (re)load
+        self._stock_basic_df: Optional[pd.DataFrame] = None
+        self._stock_basic_loaded_at: float = 0
+        self._name_to_code: Dict[str, str] = {}
+        self._code_to_name: Dict[str, str] = {}
+        self._code_names_df = pd.DataFrame(columns=['ts_code', 'name'])
+        
+        # Recent realtime_list snapshots by src: (fetched_at, df)
+        self._list_cache: Dict[str, Tuple[float, pd.DataFrame]] = {}
         
         if not self.token:
             logging.warning("TUSHARE_TOKEN not found in environment variables")
@@ -65,21 +113,26 @@ class TushareRealtimeService:
             except Exception as e:
                 logging.error(f"Failed to initialize Tushare API: {str(e)}")
     
-    def _load_cache(self, cache_key: str) -> Optional[Any]:
-        """Load data from cache if valid"""
+    def _load_cache_entry(self, cache_key: str) -> Optional[Tuple[Any, float]]:
+        """Load (data, saved timestamp) from cache if valid"""
         cache_file = self.cache_dir / f"{cache_key}.json"
         if cache_file.exists():
             try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
-                    cache_time = cache_data.get('timestamp', 0)
-                    if time.time() - cache_time < self.cache_expire_hours * 3600:
-                        logging.debug(f"✅ Loaded {cache_key} from cache")
-                        return cache_data.get('data')
+                raw = cache_file.read_bytes()
+                cache_data = orjson.loads(raw) if orjson else json.loads(raw)
+                cache_time = cache_data.get('timestamp', 0)
+                if time.time() - cache_time < self.cache_expire_hours * 3600:
+                    logging.debug(f"✅ Loaded {cache_key} from cache")
+                    return cache_data.get('data'), cache_time
             except Exception as e:
                 logging.warning(f"Cache read error: {e}")
         return None
     
+    def _load_cache(self, cache_key: str) -> Optional[Any]:
+        """Load data from cache if valid"""
+        entry = self._load_cache_entry(cache_key)
+        return entry[0] if entry else None
+    
     def _save_cache(self, cache_key: str, data: Any):
         """Save data to cache"""
         cache_file = self.cache_dir / f"{cache_key}.json"
@@ -88,35 +141,98 @@ class TushareRealtimeService:
                 'timestamp': time.time(),
                 'data': data
             }
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
+            if orjson:
+                option = orjson.OPT_INDENT_2 if self.cache_debug else 0
+                cache_file.write_bytes(orjson.dumps(cache_data, option=option))
+            else:
+                with open(cache_file, 'w', encoding='utf-8') as f:
+                    json.dump(cache_data, f, ensure_ascii=False, indent=2 if self.cache_debug else None)
             logging.debug(f"💾 Saved {cache_key} to cache")
         except Exception as e:
             logging.warning(f"Cache write error: {e}")
     
+    def _load_df_cache(self, cache_key: str) -> Optional[Tuple[pd.DataFrame, float]]:
+        """Load (DataFrame, saved timestamp) from Parquet cache if valid, falling back to the JSON cache"""
+        cache_file = self.cache_dir / f"{cache_key}.parquet"
+        meta_file = self.cache_dir / f"{cache_key}.meta.json"
+        if cache_file.exists() and meta_file.exists():
+            try:
+                with open(meta_file, 'r', encoding='utf-8') as f:
+                    cache_time = json.load(f).get('timestamp', 0)
+                if time.time() - cache_time < self.cache_expire_hours * 3600:
+                    logging.debug(f"✅ Loaded {cache_key} from parquet cache")
+                    return pd.read_parquet(cache_file), cache_time
+            except ImportError:
+                # No Parquet engine installed; use the JSON cache
+                pass
+            except Exception as e:
+                logging.warning(f"Cache read error: {e}")
+        
+        entry = self._load_cache_entry(cache_key)
+        if entry and entry[0]:
+            try:
+                return pd.DataFrame(entry[0]), entry[1]
+            except Exception:
+                pass
+        return None
+    
+    def _save_df_cache(self, cache_key: str, df: pd.DataFrame):
+        """Save DataFrame to Parquet cache with a timestamp sidecar (JSON if no Parquet engine)"""
+        try:
+            df.to_parquet(self.cache_dir / f"{cache_key}.parquet", index=False)
+            with open(self.cache_dir / f"{cache_key}.meta.json", 'w', encoding='utf-8') as f:
+                json.dump({'timestamp': time.time()}, f)
+            logging.debug(f"💾 Saved {cache_key} to parquet cache")
+        except ImportError:
+            # Neither pyarrow nor fastparquet installed
+            self._save_cache(cache_key, df.to_dict('records'))
+        except Exception as e:
+            logging.warning(f"Cache write error: {e}")
+    
+    def _set_stock_basic(self, df: pd.DataFrame, loaded_at: Optional[float] = None):
+        """
+        Keep stock basic info in memory and build name <-> code dicts (first occurrence wins).
+        loaded_at is when the data was fetched from the API (the cache file's timestamp when
+        loaded from disk), so the in-memory copy expires together with the file.
+        """
+        self._stock_basic_df = df
+        self._stock_basic_loaded_at = loaded_at if loaded_at is not None else time.time()
+        by_name = df.drop_duplicates(subset='name')
+        by_code = df.drop_duplicates(subset='ts_code')
+        self._name_to_code = dict(zip(by_name['name'], by_name['ts_code']))
+        self._code_to_name = dict(zip(by_code['ts_code'], by_code['name']))
+        self._code_names_df = by_code[['ts_code', 'name']]
+    
+    def _stock_basic_fresh(self) -> bool:
+        """Whether the in-memory stock basic info (and its lookup dicts) is still valid"""
+        return (self._stock_basic_df is not None
+                and time.time() - self._stock_basic_loaded_at < self.cache_expire_hours * 3600)
+    
     async def _get_stock_basic(self) -> Optional[pd.DataFrame]:
         """Get stock basic info with cache support"""
         if not self.pro:
             return None
         
+        # Serve from memory while fresh, avoiding disk reads and DataFrame rebuilds
+        if self._stock_basic_fresh():
+            return self._stock_basic_df
+        
         # Try load from cache first
-        cached_data = self._load_cache('stock_basic')
-        if cached_data:
-            try:
-                return pd.DataFrame(cached_data)
-            except Exception:
-                pass
+        cached = self._load_df_cache('stock_basic')
+        if cached is not None and not cached[0].empty:
+            df, cache_time = cached
+            self._set_stock_basic(df, loaded_at=cache_time)
+            return df
         
         # Fetch from API
         try:
-            loop = asyncio.get_running_loop()
-            df = await loop.run_in_executor(
-                None, 
-                lambda: self.pro.stock_basic(exchange='', list_status='L', fields='ts_code,symbol,name')
+            df = await asyncio.to_thread(
+                self.pro.stock_basic, exchange='', list_status='L', fields='ts_code,symbol,name'
             )
             
             if df is not None and not df.empty:
-                self._save_cache('stock_basic', df.to_dict('records'))
+                self._save_df_cache('stock_basic', df)
+                self._set_stock_basic(df)
                 return df
         except Exception as e:
             logging.error(f"Error fetching stock_basic: {e}")
@@ -125,49 +241,36 @@ class TushareRealtimeService:
 
     async def _get_code_by_name(self, names: List[str]) -> Dict[str, str]:
         """Get stock codes by names"""
-        df = await self._get_stock_basic()
-        if df is None or df.empty:
-            return {}
+        if not self._stock_basic_fresh():
+            await self._get_stock_basic()
         
-        name_map = {}
-        for name in names:
-            row = df[df['name'] == name]
-            if not row.empty:
-                name_map[name] = row.iloc[0]['ts_code']
-        
-        return name_map
+        # Dict probes per name; the dicts are built once per stock_basic load
+        return {name: self._name_to_code[name] for name in names if name in self._name_to_code}
 
     async def _get_name_by_code(self, codes: List[str]) -> Dict[str, str]:
         """Get stock names by codes"""
-        df = await self._get_stock_basic()
-        if df is None or df.empty:
-            return {}
-        
-        code_map = {}
-        for code in codes:
-            row = df[df['ts_code'] == code]
-            if not row.empty:
-                code_map[code] = row.iloc[0]['name']
+        if not self._stock_basic_fresh():
+            await self._get_stock_basic()
         
-        return code_map
+        return {code: self._code_to_name[code] for code in codes if code in self._code_to_name}
 
     def _validate_freq(self, freq: str) -> str:
         """Validate and normalize frequency parameter"""
         freq_upper = freq.upper()
         if freq_upper not in self.FREQ_OPTIONS:
-            raise ValueError(f"Invalid freq: {freq}. Must be one of {self.FREQ_OPTIONS}")
+            raise ValueError(f"Invalid freq: {freq}. Must be one of {list(self.FREQ_OPTIONS_DISPLAY)}")
         return freq_upper
 
     async def _get_realtime_minute(
         self, 
-        ts_codes: str, 
+        ts_codes: Union[List[str], str], 
         freq: str = "1MIN"
     ) -> Dict[str, Any]:
         """
         获取A股实时分钟行情数据 (内部方法)
         
         Args:
-            ts_codes: 股票代码，支持多个逗号分隔 (e.g., '600000.SH' 或 '600000.SH,000001.SZ')
+            ts_codes: 股票代码列表，或逗号分隔的字符串 (e.g., ['600000.SH', '000001.SZ'] 或 '600000.SH,000001.SZ')
             freq: 分钟周期，支持 5MIN/15MIN/30MIN/60MIN
             
         Returns:
@@ -184,12 +287,12 @@ class TushareRealtimeService:
         except ValueError as e:
             return {"success": False, "error": str(e)}
         
+        # rt_min takes a comma separated string; join only here
+        if isinstance(ts_codes, list):
+            ts_codes = ",".join(ts_codes)
+        
         try:
-            loop = asyncio.get_running_loop()
-            df = await loop.run_in_executor(
-                None,
-                lambda: self.pro.rt_min(ts_code=ts_codes, freq=freq)
-            )
+            df = await asyncio.to_thread(self.pro.rt_min, ts_code=ts_codes, freq=freq)
             
             if df is None or df.empty:
                 return {
@@ -203,26 +306,17 @@ class TushareRealtimeService:
                     }
                 }
             
-            # Get stock names for enrichment
-            codes_list = ts_codes.split(',')
-            code_name_map = await self._get_name_by_code(codes_list)
-            
-            # Process data
-            records = []
-            for _, row in df.iterrows():
-                code = row['ts_code']
-                record = {
-                    "ts_code": code,
-                    "name": code_name_map.get(code, ""),
-                    "time": str(row['time']) if pd.notna(row['time']) else None,
-                    "open": float(row['open']) if pd.notna(row['open']) else None,
-                    "close": float(row['close']) if pd.notna(row['close']) else None,
-                    "high": float(row['high']) if pd.notna(row['high']) else None,
-                    "low": float(row['low']) if pd.notna(row['low']) else None,
-                    "vol": float(row['vol']) if pd.notna(row['vol']) else None,
-                    "amount": float(row['amount']) if pd.notna(row['amount']) else None,
-                }
-                records.append(record)
+            # Enrich with stock names via a left join
+            if not self._stock_basic_fresh():
+                await self._get_stock_basic()
+            df = df.merge(self._code_names_df, on='ts_code', how='left')
+            
+            # Process data (column-wise, no per-row Series)
+            out = _nullable(df[['open', 'close', 'high', 'low', 'vol', 'amount']].astype(float))
+            out.insert(0, 'time', _to_str(df['time']))
+            out.insert(0, 'name', df['name'].fillna(""))
+            out.insert(0, 'ts_code', df['ts_code'])
+            records = out.to_dict('records')
             
             return {
                 "success": True,
@@ -231,7 +325,7 @@ class TushareRealtimeService:
                     "ts_codes": ts_codes,
                     "freq": freq,
                     "count": len(records),
-                    "query_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    "query_time": _cached_now_str()
                 }
             }
             
@@ -268,8 +362,7 @@ class TushareRealtimeService:
         
         not_found = [n for n in names_list if n not in name_code_map]
         
-        ts_codes = ",".join(name_code_map.values())
-        result = await self._get_realtime_minute(ts_codes, freq)
+        result = await self._get_realtime_minute(list(name_code_map.values()), freq)
         
         if not_found and result.get("success"):
             result["metadata"]["not_found_names"] = not_found
@@ -278,7 +371,7 @@ class TushareRealtimeService:
 
     async def _get_realtime_quote(
         self, 
-        ts_codes: str,
+        ts_codes: Union[List[str], str],
         src: str = "sina"
     ) -> Dict[str, Any]:
         """
@@ -286,7 +379,7 @@ class TushareRealtimeService:
         基于 realtime_quote 接口，返回真正的实时价格
         
         Args:
-            ts_codes: 股票代码，支持多个逗号分隔 (sina源最多50个，dc源只支持单个)
+            ts_codes: 股票代码列表，或逗号分隔的字符串 (按sina源每批50个、dc源每批1个并发请求)
             src: 数据源 sina-新浪(默认) dc-东方财富
             
         Returns:
@@ -296,11 +389,23 @@ class TushareRealtimeService:
             return {"success": False, "error": "Tushare not available"}
         
         try:
-            loop = asyncio.get_running_loop()
-            df = await loop.run_in_executor(
-                None,
-                lambda: ts.realtime_quote(ts_code=ts_codes, src=src)
-            )
+            if isinstance(ts_codes, list):
+                codes = ts_codes
+                ts_codes = ",".join(codes)
+            else:
+                codes = [c.strip() for c in ts_codes.split(',') if c.strip()]
+            size = self.QUOTE_CHUNK_SIZE.get(src, 1)
+            chunks = [",".join(codes[i:i + size]) for i in range(0, len(codes), size)]
+            
+            sem = asyncio.Semaphore(self.QUOTE_CONCURRENCY)
+            
+            async def fetch(chunk: str) -> Optional[pd.DataFrame]:
+                async with sem:
+                    return await asyncio.to_thread(ts.realtime_quote, ts_code=chunk, src=src)
+            
+            frames = await asyncio.gather(*(fetch(c) for c in chunks))
+            frames = [f for f in frames if f is not None and not f.empty]
+            df = pd.concat(frames, ignore_index=True) if frames else None
             
             if df is None or df.empty:
                 return {
@@ -314,27 +419,35 @@ class TushareRealtimeService:
                     }
                 }
             
-            # Process data
-            records = []
-            for _, row in df.iterrows():
-                record = {
-                    "ts_code": str(row.get('TS_CODE', '')),
-                    "name": str(row.get('NAME', '')),
-                    "price": float(row['PRICE']) if pd.notna(row.get('PRICE')) else None,
-                    "change": round(float(row['PRICE']) - float(row['PRE_CLOSE']), 2) if pd.notna(row.get('PRICE')) and pd.notna(row.get('PRE_CLOSE')) else None,
-                    "pct_change": round((float(row['PRICE']) - float(row['PRE_CLOSE'])) / float(row['PRE_CLOSE']) * 100, 2) if pd.notna(row.get('PRICE')) and pd.notna(row.get('PRE_CLOSE')) and float(row.get('PRE_CLOSE', 0)) != 0 else None,
-                    "open": float(row['OPEN']) if pd.notna(row.get('OPEN')) else None,
-                    "high": float(row['HIGH']) if pd.notna(row.get('HIGH')) else None,
-                    "low": float(row['LOW']) if pd.notna(row.get('LOW')) else None,
-                    "pre_close": float(row['PRE_CLOSE']) if pd.notna(row.get('PRE_CLOSE')) else None,
-                    "volume": int(row['VOLUME']) if pd.notna(row.get('VOLUME')) else None,
-                    "amount": float(row['AMOUNT']) if pd.notna(row.get('AMOUNT')) else None,
-                    "bid": float(row['BID']) if pd.notna(row.get('BID')) else None,
-                    "ask": float(row['ASK']) if pd.notna(row.get('ASK')) else None,
-                    "date": str(row.get('DATE', '')),
-                    "time": str(row.get('TIME', '')),
-                }
-                records.append(record)
+            # Process data (column-wise, no per-row Series); missing columns become null
+            df = df.reindex(columns=[
+                'TS_CODE', 'NAME', 'PRICE', 'PRE_CLOSE', 'OPEN', 'HIGH', 'LOW',
+                'VOLUME', 'AMOUNT', 'BID', 'ASK', 'DATE', 'TIME'
+            ])
+            numeric_cols = ['PRICE', 'PRE_CLOSE', 'OPEN', 'HIGH', 'LOW', 'VOLUME', 'AMOUNT', 'BID', 'ASK']
+            df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric, errors='coerce')
+            price = df['PRICE']
+            pre_close = df['PRE_CLOSE']
+            change = price - pre_close
+            valid_pre_close = pre_close.ne(0) & pre_close.notna()
+            out = pd.DataFrame({
+                "ts_code": _to_str(df['TS_CODE']),
+                "name": _to_str(df['NAME']),
+                "price": price,
+                "change": change.round(2),
+                "pct_change": np.where(valid_pre_close, change / pre_close * 100, np.nan).round(2),
+                "open": df['OPEN'],
+                "high": df['HIGH'],
+                "low": df['LOW'],
+                "pre_close": pre_close,
+                "volume": np.trunc(df['VOLUME']).astype('Int64'),
+                "amount": df['AMOUNT'],
+                "bid": df['BID'],
+                "ask": df['ASK'],
+                "date": _to_str(df['DATE']),
+                "time": _to_str(df['TIME']),
+            })
+            records = _nullable(out).to_dict('records')
             
             return {
                 "success": True,
@@ -343,7 +456,7 @@ class TushareRealtimeService:
                     "ts_codes": ts_codes,
                     "src": src,
                     "count": len(records),
-                    "query_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    "query_time": _cached_now_str()
                 }
             }
             
@@ -411,8 +524,7 @@ class TushareRealtimeService:
         # Find names that couldn't be resolved
         not_found = [n for n in names_list if n not in name_code_map]
         
-        ts_codes = ",".join(name_code_map.values())
-        result = await self._get_realtime_quote(ts_codes, src="sina")
+        result = await self._get_realtime_quote(list(name_code_map.values()), src="sina")
         
         if not_found and result.get("success"):
             result["metadata"]["not_found_names"] = not_found
@@ -454,13 +566,9 @@ class TushareRealtimeService:
             return {"success": False, "error": "Only single stock code is supported for realtime_tick"}
         
         try:
-            loop = asyncio.get_running_loop()
-            df = await loop.run_in_executor(
-                None,
-                lambda: ts.realtime_tick(ts_code=ts_code, src=src)
-            )
+            records = [r async for r in self._iter_realtime_tick(ts_code, src)]
             
-            if df is None or df.empty:
+            if not records:
                 return {
                     "success": True,
                     "data": [],
@@ -476,19 +584,6 @@ class TushareRealtimeService:
             code_name_map = await self._get_name_by_code([ts_code])
             stock_name = code_name_map.get(ts_code, "")
             
-            # Process data
-            records = []
-            for _, row in df.iterrows():
-                record = {
-                    "time": str(row.get('TIME', row.get('time', ''))) if pd.notna(row.get('TIME', row.get('time'))) else None,
-                    "price": float(row.get('PRICE', row.get('price', 0))) if pd.notna(row.get('PRICE', row.get('price'))) else None,
-                    "change": float(row.get('CHANGE', row.get('change', 0))) if pd.notna(row.get('CHANGE', row.get('change'))) else None,
-                    "volume": int(row.get('VOLUME', row.get('volume', 0))) if pd.notna(row.get('VOLUME', row.get('volume'))) else None,
-                    "amount": float(row.get('AMOUNT', row.get('amount', 0))) if pd.notna(row.get('AMOUNT', row.get('amount'))) else None,
-                    "type": str(row.get('TYPE', row.get('type', ''))) if pd.notna(row.get('TYPE', row.get('type'))) else None,
-                }
-                records.append(record)
-            
             return {
                 "success": True,
                 "data": records,
@@ -497,7 +592,7 @@ class TushareRealtimeService:
                     "name": stock_name,
                     "src": src,
                     "count": len(records),
-                    "query_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    "query_time": _cached_now_str()
                 }
             }
             
@@ -505,6 +600,49 @@ class TushareRealtimeService:
             logging.error(f"Error fetching realtime tick: {e}")
             return {"success": False, "error": str(e)}
 
+    async def _iter_realtime_tick(
+        self,
+        ts_code: str,
+        src: str = "sina"
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        逐条产出实时分笔成交数据（内部方法，供流式推送使用）
+        按 TICK_CHUNK_SIZE 分块转换，避免同时持有完整记录列表和 DataFrame；
+        接口异常直接抛出，由调用方处理
+        
+        Args:
+            ts_code: 股票代码，单次只能输入一个股票
+            src: 数据源 sina-新浪(默认) dc-东方财富
+            
+        Yields:
+            Dict: 单条分笔成交记录，字段同 _get_realtime_tick
+        """
+        if not TUSHARE_AVAILABLE:
+            raise RuntimeError("Tushare not available")
+        
+        df = await asyncio.to_thread(ts.realtime_tick, ts_code=ts_code, src=src)
+        
+        if df is None or df.empty:
+            return
+        
+        # sina returns upper-case column names, dc lower-case
+        df.columns = df.columns.str.lower()
+        out = df.reindex(columns=['time', 'price', 'change', 'volume', 'amount', 'type'])
+        
+        # Process data (column-wise, no per-row Series)
+        numeric_cols = ['price', 'change', 'volume', 'amount']
+        out[numeric_cols] = out[numeric_cols].apply(pd.to_numeric, errors='coerce')
+        out['volume'] = np.trunc(out['volume']).astype('Int64')
+        out['time'] = _to_str(out['time'])
+        out['type'] = _to_str(out['type'])
+        
+        for start in range(0, len(out), self.TICK_CHUNK_SIZE):
+            chunk = out.iloc[start:start + self.TICK_CHUNK_SIZE]
+            for record in _nullable(chunk).to_dict('records'):
+                yield record
+            # Let other tasks run between chunks
+            await asyncio.sleep(0)
+
     async def get_realtime_tick_by_name(
         self,
         stock_name: str,
@@ -556,7 +694,7 @@ class TushareRealtimeService:
     async def _get_realtime_list(
         self,
         src: str = "dc"
-    ) -> Dict[str, Any]:
+    ) -> Optional[pd.DataFrame]:
         """
         获取实时涨跌幅排名（内部方法）
         基于 realtime_list 接口（爬虫），返回全市场股票实时涨跌幅排名
@@ -565,7 +703,7 @@ class TushareRealtimeService:
             src: 数据源 sina-新浪 dc-东方财富(默认)
             
         Returns:
-            Dict: 包含全市场股票实时排名数据
+            pd.DataFrame: 全市场股票实时排名数据，无数据时返回 None（异常由调用方处理）
             
             东财数据(dc)字段：
                 - ts_code: 股票代码
@@ -602,56 +740,24 @@ class TushareRealtimeService:
                 - amount: 成交金额（元）
                 - time: 当前时间
         """
-        if not TUSHARE_AVAILABLE:
-            return {"success": False, "error": "Tushare not available"}
+        fetched_at, cached_df = self._list_cache.get(src, (0, None))
+        if cached_df is not None and time.time() - fetched_at < self.list_cache_seconds:
+            # Copy so callers can't mutate the shared snapshot
+            return cached_df.copy()
         
-        try:
-            loop = asyncio.get_running_loop()
-            df = await loop.run_in_executor(
-                None,
-                lambda: ts.realtime_list(src=src)
-            )
-            
-            if df is None or df.empty:
-                return {
-                    "success": True,
-                    "data": [],
-                    "metadata": {
-                        "src": src,
-                        "count": 0,
-                        "message": "No data returned (market may be closed)"
-                    }
-                }
-            
-            # Process data - convert DataFrame to list of dicts
-            records = df.to_dict('records')
-            
-            # Clean up the records (handle NaN values)
-            cleaned_records = []
-            for record in records:
-                cleaned = {}
-                for key, value in record.items():
-                    if pd.isna(value):
-                        cleaned[key] = None
-                    elif isinstance(value, (int, float)):
-                        cleaned[key] = value
-                    else:
-                        cleaned[key] = str(value)
-                cleaned_records.append(cleaned)
-            
-            return {
-                "success": True,
-                "data": cleaned_records,
-                "metadata": {
-                    "src": src,
-                    "count": len(cleaned_records),
-                    "query_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                }
-            }
-            
-        except Exception as e:
-            logging.error(f"Error fetching realtime list: {e}")
-            return {"success": False, "error": str(e)}
+        df = await asyncio.to_thread(ts.realtime_list, src=src)
+        
+        if df is None or df.empty:
+            return None
+        
+        # Shrink the ~5000-row frame: narrow integer columns, categorical names
+        for col in df.select_dtypes(include='integer').columns:
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+        if 'name' in df.columns:
+            df['name'] = df['name'].astype('category')
+        
+        self._list_cache[src] = (time.time(), df)
+        return df.copy()
 
     async def get_realtime_list_top(
         self,
@@ -723,25 +829,46 @@ class TushareRealtimeService:
             - 数据来自网络爬虫，非官方接口，仅供研究学习
             - 非交易时段返回收盘数据
         """
-        result = await self._get_realtime_list(src)
-        
-        if not result.get("success") or not result.get("data"):
-            return result
+        if not TUSHARE_AVAILABLE:
+            return {"success": False, "error": "Tushare not available"}
         
         try:
-            # Convert to DataFrame for sorting
-            df = pd.DataFrame(result["data"])
+            df = await self._get_realtime_list(src)
             
-            # Sort by specified column
-            if sort_by in df.columns:
-                df = df.sort_values(by=sort_by, ascending=ascending, na_position='last')
+            if df is None:
+                return {
+                    "success": True,
+                    "data": [],
+                    "metadata": {
+                        "src": src,
+                        "count": 0,
+                        "message": "No data returned (market may be closed)"
+                    }
+                }
             
-            # Get top N
-            df_top = df.head(top_n)
+            # Partial sort for top N on plain numeric columns; nlargest/nsmallest do not
+            # reliably keep NaN rows across pandas versions, so columns with nulls, bools
+            # and non-numeric columns take the full sort (NaN last)
+            sort_col = df[sort_by] if sort_by in df.columns else None
+            if (sort_col is not None
+                    and pd.api.types.is_numeric_dtype(sort_col)
+                    and not pd.api.types.is_bool_dtype(sort_col)
+                    and not sort_col.hasnans):
+                if ascending:
+                    df_top = df.nsmallest(top_n, sort_by)
+                else:
+                    df_top = df.nlargest(top_n, sort_by)
+            elif sort_col is not None:
+                df_top = df.sort_values(by=sort_by, ascending=ascending, na_position='last').head(top_n)
+            else:
+                df_top = df.head(top_n)
+            
+            # Only the top N rows are materialized, NaN as None
+            cleaned_records = _nullable(df_top).to_dict('records')
             
             return {
                 "success": True,
-                "data": df_top.to_dict('records'),
+                "data": cleaned_records,
                 "metadata": {
                     "src": src,
                     "top_n": top_n,
@@ -749,7 +876,7 @@ class TushareRealtimeService:
                     "ascending": ascending,
                     "count": len(df_top),
                     "total_stocks": len(df),
-                    "query_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    "query_time": _cached_now_str()
                 }
             }
             